@@ -2,13 +2,22 @@
 
 import sys
 
-n = int(raw_input().strip())
-B = raw_input().strip()
+def count_breaks(chunks, pattern):
+	'''Greedy count of the non-overlapping pattern occurrences in a stream of chunks,
+	the number of one-character changes needed to make the stream pattern free'''
+	count = 0
+	tail = ''
+	for chunk in chunks:
+		data = tail + chunk.rstrip()
+		match_end = 0
+		idx = data.find(pattern)
+		while idx != -1:
+			count += 1
+			match_end = idx + len(pattern)
+			idx = data.find(pattern, match_end)
+		# Keep only what could still start a match spanning into the next chunk
+		tail = data[max(match_end, len(data) - len(pattern) + 1):]
+	return count
 
-c = 0
-while True:
-	idx = B.find('010')
-	if idx == -1: break
-	B = B[:idx] + '011' + B[idx+3:]
-	c += 1
-print(c)
\ No newline at end of file
+n = int(sys.stdin.readline().strip())
+print(count_breaks(iter(lambda: sys.stdin.read(1 << 16), ''), '010'))
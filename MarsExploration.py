@@ -2,12 +2,19 @@
 
 import sys
 
-S = raw_input().strip()
-err_count = 0
+def pattern_mismatches(chunks, pattern):
+	'''Characters differing from pattern repeated along a stream of chunks.
+	Each pattern position is checked with one strided slice and count per chunk.'''
+	mismatches = 0
+	offset = 0
+	for chunk in chunks:
+		for idx, expected in enumerate(pattern):
+			column = chunk[(idx - offset) % len(pattern)::len(pattern)]
+			mismatches += len(column) - column.count(expected)
+		offset = (offset + len(chunk)) % len(pattern)
+	return mismatches
 
-for idx in range(len(S)/3):
-	if S[idx*3] != 'S': err_count += 1
-	if S[idx*3+1] != 'O': err_count += 1
-	if S[idx*3+2] != 'S': err_count += 1
+chunks = (chunk.rstrip() for chunk in iter(lambda: sys.stdin.read(1 << 16), ''))
+err_count = pattern_mismatches(chunks, 'SOS')
 
-print (err_count)
\ No newline at end of file
+print (err_count)
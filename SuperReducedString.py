@@ -2,28 +2,18 @@
 
 import sys
 
-def reduce_string(val):
-    '''reduce_string documentation'''
+def reduce_string(chunks):
+    '''Removes adjacent equal pairs until none are left, in one pass over a stream of chunks'''
     result = []
-    i = 0
-    while i < len(val) - 1:
-        if val[i] != val[i + 1]:
-            result.append(val[i])
-            i += 1
-        else:
-            i += 2
-    if i == len(val) - 1:
-        result.append(val[-1])
+    for chunk in chunks:
+        for c in chunk.rstrip():
+            if result and result[-1] == c:
+                result.pop()
+            else:
+                result.append(c)
     return ''.join(result)
 
-value = sys.stdin.readlines()[0]
-value_len_new = -1
-value_len = 1
-
-while value_len != value_len_new:
-    value_len = len(value)
-    value = reduce_string(value)
-    value_len_new = len(value)
+value = reduce_string(iter(lambda: sys.stdin.read(1 << 16), ''))
 
 if len(value) == 0:
     print('Empty String')
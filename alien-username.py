@@ -2,16 +2,13 @@
 # Solution for https://www.hackerrank.com/challenges/alien-username
 
 import re
+from multiquery import write_lines
+
+username_pattern = re.compile(r'^[_\.][0-9]+[a-zA-Z]*_?$')
 
 def is_valid_username(s):
-    pattern = r'^[_\.][0-9]+[a-zA-Z]*_?$'
-    match = re.match(pattern, s)
-    return match
+    return username_pattern.match(s)
 
 n = int(raw_input().strip())
-for i in range(n):
-    s = raw_input().strip()
-    if is_valid_username(s):
-        print 'VALID'
-    else:
-        print 'INVALID'
\ No newline at end of file
+write_lines('VALID' if is_valid_username(raw_input().strip()) else 'INVALID'
+            for i in xrange(n))
\ No newline at end of file
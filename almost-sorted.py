@@ -1,56 +1,69 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/almost-sorted
 
-n = int(raw_input().strip())
-values = [int(s) for s in raw_input().strip().split(' ')]
-ascending = 1
-descending = 2
+import sys
 
-def is_ascending_or_descending(data, direction):
-    if len(data) <= 1:
-        return True
-    item = data[0]
-    for i in range(1, len(data)):
-        if direction == ascending and item > data[i]:
+def is_ascending(data, start, end):
+    '''True when data[start:end] is in non-decreasing order'''
+    for i in xrange(start + 1, end):
+        if data[i - 1] > data[i]:
             return False
-        if direction == descending and item < data[i]:
+    return True
+
+def can_swap(values, l, r):
+    '''True when swapping values[l] and values[r] sorts values, given that
+    values[:l + 1] and values[r:] are already ascending'''
+    if l > 0 and values[l - 1] > values[r]:
+        return False
+    if r < len(values) - 1 and values[l] > values[r + 1]:
+        return False
+    if r == l + 1:
+        return values[r] <= values[l]
+    return (values[r] <= values[l + 1] and values[r - 1] <= values[l]
+            and is_ascending(values, l + 1, r))
+
+def can_reverse(values, l, r):
+    '''True when reversing values[l:r + 1] sorts values, given that
+    values[:l + 1] and values[r:] are already ascending'''
+    if l > 0 and values[l - 1] > values[r]:
+        return False
+    if r < len(values) - 1 and values[l] > values[r + 1]:
+        return False
+    for i in xrange(l + 1, r + 1):
+        if values[i - 1] < values[i]:
             return False
-        item = data[i]
     return True
 
-if len(values) <= 1:
-    print 'yes'
+def sort_operation(values):
+    '''('swap' | 'reverse', l, r) with 0 based indexes for the single operation
+    that sorts values, ('sorted',) when nothing is needed or None when impossible'''
+    l = 0
+    while l < len(values) - 1 and values[l] <= values[l + 1]:
+        l += 1
+    if l >= len(values) - 1:
+        return ('sorted',)
+    r = len(values) - 1
+    while values[r - 1] <= values[r]:
+        r -= 1
+    # Equal neighbours could be the ones that belong on the other side
+    while l > 0 and values[l - 1] == values[l]:
+        l -= 1
+    while r < len(values) - 1 and values[r + 1] == values[r]:
+        r += 1
+    if can_swap(values, l, r):
+        return ('swap', l, r)
+    if can_reverse(values, l, r):
+        return ('reverse', l, r)
+    return None
+
+data = sys.stdin.read().split()
+n = int(data[0])
+values = map(int, data[1:n + 1])
+
+operation = sort_operation(values)
+if operation is None:
+    print 'no'
 else:
-    cu_v = values[0]
-    de_count, de_l, de_r, direction = 0, None, None, None    
-    for i in range(1, len(values)):
-        ne_v = values[i]
-        if cu_v > ne_v and direction in { None, ascending }: # Change to descending
-            de_count += 1
-            direction = descending
-            de_l = i - 1
-        if cu_v < ne_v and direction in { None, descending }: # Change to ascending
-            direction = ascending
-            de_r = i - 1
-        cu_v = ne_v
-    
-    if de_count <= 0:
-        print 'yes'
-    elif de_count > 1:
-        print 'no'
-    else:
-        if de_r is None or de_r < de_l:
-            de_r = len(values) - 1
-        while de_r < len(values) and values[de_r] == values[de_r+1]:
-            de_r += 1
-        while de_l > 0 and values[de_l] == values[de_l-1]:
-            de_l -= 1
-        values = values[:de_l] + list(reversed(values[de_l:de_r + 1])) + values[de_r + 1:]
-        if is_ascending_or_descending(values, ascending):
-            print 'yes'
-            if de_r - de_l + 1 > 2:
-                print 'reverse', de_l + 1, de_r + 1
-            else:
-                print 'swap', de_l + 1, de_r + 1
-        else:
-            print 'no'
\ No newline at end of file
+    print 'yes'
+    if operation[0] != 'sorted':
+        print operation[0], operation[1] + 1, operation[2] + 1
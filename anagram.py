@@ -1,14 +1,13 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/anagram
 
-T = int(raw_input().strip())
+import sys
+from multiquery import solve_all, write_lines
 
-for c in xrange(T):
-    s1s2 = raw_input().strip()
+def anagram_changes(s1s2):
     l = len(s1s2)
     if l % 2:
-        print -1
-        continue
+        return -1
     l = l / 2
     s1 = s1s2[:l]
     s2 = s1s2[l:]
@@ -20,5 +19,12 @@ for c in xrange(T):
     change_count = 0
     for ch in chr_s2:
         change_count += abs(chr_s2[ch])
-    change_count = change_count / 2
-    print change_count
\ No newline at end of file
+    return change_count / 2
+
+if __name__ == '__main__':
+    data = sys.stdin.read().split()
+    T = int(data[0])
+    cases = data[1:T + 1]
+
+    results = solve_all(anagram_changes, cases, chunksize=1000, min_parallel=10000)
+    write_lines(str(result) for result in results)
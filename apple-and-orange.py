@@ -2,6 +2,13 @@
 # Solution for https://www.hackerrank.com/challenges/apple-and-orange
 
 import sys
+from bisect import bisect_left, bisect_right
+
+def landed_counts(tree, offsets, houses):
+    '''For every house (s, t), how many of the fruits falling at tree + offset land on it.
+    Landing spots are sorted once, then each house takes two binary searches.'''
+    spots = sorted(tree + d for d in offsets)
+    return [bisect_right(spots, t) - bisect_left(spots, s) for s, t in houses]
 
 s,t = [int(x) for x in raw_input().strip().split(' ')]
 a,b = [int(x) for x in raw_input().strip().split(' ')]
@@ -9,17 +16,5 @@ m,n = [int(x) for x in raw_input().strip().split(' ')]
 apple = map(int,raw_input().strip().split(' '))
 orange = map(int,raw_input().strip().split(' '))
 
-apple_count = 0
-for idx in range(m):
-    v = a + apple[idx]
-    if s <= v <= t:
-        apple_count += 1
-
-orange_count = 0
-for idx in range(n):
-    v = b + orange[idx]
-    if s <= v <= t:
-        orange_count += 1
-
-print apple_count
-print orange_count
\ No newline at end of file
+print landed_counts(a, apple, [(s, t)])[0]
+print landed_counts(b, orange, [(s, t)])[0]
\ No newline at end of file
@@ -1,12 +1,99 @@
-
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/beautiful-days-at-the-movies
 import sys
 
-i, j, k = [int(x) for x in raw_input().strip().split(' ')]
+# Ranges up to this many days are walked directly instead of counted
+max_walk = 10 ** 4
+
+def digit_weights(length, k):
+    '''Weight mod k of every digit, most significant first, in v - reverse(v)'''
+    return [(10 ** (length - 1 - p) - 10 ** p) % k for p in xrange(length)]
+
+def add_digit(counts, weight, k):
+    '''Residue counts after appending one free digit of the given weight'''
+    result = {}
+    for r, c in counts.iteritems():
+        for d in xrange(10):
+            rd = (r + d * weight) % k
+            result[rd] = result.get(rd, 0) + c
+    return result
+
+def split_cost(length, split, k):
+    '''Rough work for suffix tables from split on plus enumerating the digits before it'''
+    tables = sum(10 * min(k, 10 ** (length - t - 1)) for t in xrange(split, length))
+    return tables + 10 ** split
+
+# Suffix tables by length for the k in residue_tables_k only
+residue_tables = {}
+residue_tables_k = None
 
-count = 0
-for v in range(i, j+1):
-    if abs(v - int(str(v)[::-1])) % k == 0:
+def suffix_tables(length, k):
+    '''(split, tables) where tables[t] counts the residues of the digits at
+    positions t.. of a length digit number, for every t from split on.
+    Digits before split are enumerated meet-in-the-middle style instead, at
+    the split that the table sizes (bounded by k) make cheapest.'''
+    global residue_tables_k
+    if k != residue_tables_k:
+        residue_tables.clear()
+        residue_tables_k = k
+    if length not in residue_tables:
+        split = min(xrange(1, length + 1), key=lambda s: split_cost(length, s, k))
+        weights = digit_weights(length, k)
+        tables = {length: {0: 1}}
+        for t in xrange(length - 1, split - 1, -1):
+            tables[t] = add_digit(tables[t + 1], weights[t], k)
+        residue_tables[length] = (split, tables)
+    return residue_tables[length]
+
+def count_length(length, N, k):
+    '''Beautiful days with exactly length digits in [1, N], counted digit by digit'''
+    if N < 10 ** (length - 1):
+        return 0
+    N = min(N, 10 ** length - 1)
+    split, tables = suffix_tables(length, k)
+    weights = digit_weights(length, k)
+    count = 0
+    r = 0
+    for pos, top in enumerate(int(d) for d in str(N)):
+        first = 1 if pos == 0 else 0
+        if top > first:
+            # Free digits between pos and split, matched against the suffix table
+            start = max(pos + 1, split)
+            middle = {0: 1}
+            for t in xrange(pos + 1, start):
+                middle = add_digit(middle, weights[t], k)
+            suffix = tables[start]
+            for d in xrange(first, top):
+                a = r + d * weights[pos]
+                for b, c in middle.iteritems():
+                    count += c * suffix.get(-(a + b) % k, 0)
+        r = (r + top * weights[pos]) % k
+    if r == 0:
         count += 1
-print count
\ No newline at end of file
+    return count
+
+def count_up_to(N, k):
+    '''Beautiful days in [1, N]'''
+    if N <= 0:
+        return 0
+    return sum(count_length(length, N, k) for length in xrange(1, len(str(N)) + 1))
+
+def beautiful_days(queries):
+    '''Number of beautiful days for every (i, j, k) in queries'''
+    result = [0] * len(queries)
+    # Grouped by k so the suffix tables are built once per k
+    for q in sorted(xrange(len(queries)), key=lambda q: queries[q][2]):
+        i, j, k = queries[q]
+        if j - i + 1 <= max_walk:
+            count = 0
+            for v in xrange(i, j+1):
+                if abs(v - int(str(v)[::-1])) % k == 0:
+                    count += 1
+        else:
+            count = count_up_to(j, k) - count_up_to(i - 1, k)
+        result[q] = count
+    return result
+
+i, j, k = [int(x) for x in raw_input().strip().split(' ')]
+
+print beautiful_days([(i, j, k)])[0]
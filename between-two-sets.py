@@ -2,30 +2,86 @@
 # Solution for https://www.hackerrank.com/challenges/between-two-sets
 
 import sys
+from fractions import gcd
 
-n, m = map(int, raw_input().strip().split(' '))
-A = map(int, raw_input().strip().split(' '))
-B = map(int, raw_input().strip().split(' '))
-
-min_a = min(A)
-min_b = min(B)
+def lcm(a, b):
+    return a // gcd(a, b) * b
 
-between_count = 0
+small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
 
-if min_a <= min_b:
-    for val in range(min_a, min_b + 1):
-        val_is_between = True
-        for a_i in A:
-            if val % a_i: 
-                val_is_between = False
-                break
-        if not val_is_between: 
+def is_prime(n):
+    '''Miller-Rabin test, exact for n < 3.3 * 10**24 and probabilistic above'''
+    if n < 2:
+        return False
+    for p in small_primes:
+        if not n % p:
+            return n == p
+    d, s = n - 1, 0
+    while not d % 2:
+        d //= 2
+        s += 1
+    for a in small_primes:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
             continue
-        for b_i in B:
-            if b_i % val: 
-                val_is_between = False
+        for i in xrange(s - 1):
+            x = x * x % n
+            if x == n - 1:
                 break
-        if val_is_between: 
-            between_count += 1
-            
-print between_count
\ No newline at end of file
+        else:
+            return False
+    return True
+
+def pollard_rho(n):
+    '''A non-trivial factor of the odd composite n'''
+    c = 1
+    while True:
+        x = y = 2
+        d = 1
+        while d == 1:
+            x = (x * x + c) % n
+            y = (y * y + c) % n
+            y = (y * y + c) % n
+            d = gcd(abs(x - y), n)
+        if d != n:
+            return d
+        c += 1
+
+def prime_factors(n):
+    '''Prime factorization of n as a list of (prime, exponent).
+    Small primes are divided out first, the rest is split with Pollard rho,
+    so the cost grows with the fourth root of the largest factor.'''
+    factors = {}
+    for p in small_primes:
+        while not n % p:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    pending = [n] if n > 1 else []
+    while pending:
+        m = pending.pop()
+        if is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+        else:
+            d = pollard_rho(m)
+            pending.extend((d, m // d))
+    return sorted(factors.items())
+
+def between_values(A, B):
+    '''Yields, in increasing order, the values that every element of A divides
+    and that divide every element of B: the multiples of lcm(A) dividing gcd(B)'''
+    a_lcm = reduce(lcm, A)
+    b_gcd = reduce(gcd, B)
+    if b_gcd % a_lcm:
+        return
+    # Candidates are a_lcm * d for every divisor d of b_gcd / a_lcm
+    divisors = [1]
+    for p, exponent in prime_factors(b_gcd // a_lcm):
+        divisors = [d * p ** e for d in divisors for e in xrange(exponent + 1)]
+    for d in sorted(divisors):
+        yield a_lcm * d
+
+n, m = map(int, raw_input().strip().split(' '))
+A = map(int, raw_input().strip().split(' '))
+B = map(int, raw_input().strip().split(' '))
+
+print sum(1 for val in between_values(A, B))
@@ -1,14 +1,19 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/birthday-cake-candles
 
-n = int(input().strip())
-candles = [int(x) for x in input().strip().split(' ')]
-frequencies = {}
-max_candle = 0
-for c in candles:
-    if c >= max_candle:
-        max_candle = c
-        frequencies.setdefault(c, 0)
-        frequencies[c] += 1
-
-print frequencies[max_candle]
\ No newline at end of file
+import sys
+
+def tallest_count(candles):
+    '''How many candles are as tall as the tallest one, in a single pass'''
+    max_candle, count = None, 0
+    for c in candles:
+        if max_candle is None or c > max_candle:
+            max_candle, count = c, 1
+        elif c == max_candle:
+            count += 1
+    return count
+
+data = sys.stdin.read().split()
+n = int(data[0])
+
+print tallest_count(int(x) for x in data[1:n + 1])
\ No newline at end of file
@@ -1,8 +1,11 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/breaking-best-and-worst-records
 
-n = int(raw_input().strip())
-scores = [int(x) for x in raw_input().strip().split(' ')]
+import sys
+
+data = sys.stdin.read().split()
+n = int(data[0])
+scores = map(int, data[1:n + 1])
 
 min_breaks, max_breaks = 0, 0
 for i, s in enumerate(scores):
@@ -1,25 +1,31 @@
 
 # Solution for https://www.hackerrank.com/challenges/caesar-cipher-1
 import sys
+import string
+
+lowers = string.ascii_lowercase
+uppers = string.ascii_uppercase
+alphabet_count = len(lowers)
+
+# At most one table per distinct shift, so the cache never grows past 26 entries
+tables = {}
+
+def shift_table(k):
+    '''Translate table rotating both letter cases by k'''
+    k %= alphabet_count
+    if k not in tables:
+        tables[k] = string.maketrans(lowers + uppers,
+                                     lowers[k:] + lowers[:k] + uppers[k:] + uppers[:k])
+    return tables[k]
+
+def cypher(chunks, k):
+    '''Yields the chunks shifted by k; a negative k deciphers'''
+    table = shift_table(k)
+    for chunk in chunks:
+        yield chunk.translate(table)
 
 n = int(raw_input().strip())
 s = raw_input().strip()
 k = int(raw_input().strip())
 
-lowers = range(ord('a'), ord('z') + 1)
-uppers = range(ord('A'), ord('Z') + 1)
-alphabet_count = len(lowers)
-
-cyphered = []
-for idx in range(len(s)):
-    curr = ord(s[idx])
-    if curr in lowers:
-        idx_curr = lowers.index(curr)
-        idx_curr = (idx_curr + k) % alphabet_count
-        curr = lowers[idx_curr]
-    elif curr in uppers:
-        idx_curr = uppers.index(curr)
-        idx_curr = (idx_curr + k) % alphabet_count
-        curr = uppers[idx_curr]
-    cyphered.append(chr(curr))
-print ''.join(cyphered)
\ No newline at end of file
+print ''.join(cypher([s], k))
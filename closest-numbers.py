@@ -1,13 +1,26 @@
-n = input()
-ar = [int(v) for v in raw_input().strip().split()]
-ar.sort()
-min_diff = None
+import sys
+import heapq
+from itertools import islice, izip
+
+def neighbour_gaps(ar):
+    '''Yields (gap, a, b) for every pair of neighbours a, b of the sorted ar'''
+    for a, b in izip(ar, islice(ar, 1, None)):
+        yield b - a, a, b
+
+def closest_pairs(ar):
+    '''Yields the neighbours of the sorted ar that are separated by the smallest gap'''
+    min_diff = min(gap for gap, a, b in neighbour_gaps(ar))
+    for gap, a, b in neighbour_gaps(ar):
+        if gap == min_diff:
+            yield a, b
 
-diff_map = { }
-for idx in range(len(ar) - 1):
-    diff = abs(ar[idx] - ar[idx+1])
-    diff_map.setdefault(diff, []).extend((ar[idx], ar[idx+1]))
-    if min_diff is None or min_diff > diff:
-        min_diff = diff
+def smallest_gaps(ar, k):
+    '''The k smallest gaps between neighbours of the sorted ar, as (gap, a, b)'''
+    return heapq.nsmallest(k, neighbour_gaps(ar))
+
+data = sys.stdin.read().split()
+n = int(data[0])
+ar = map(int, data[1:n + 1])
+ar.sort()
 
-print ' '.join(str(v) for v in diff_map[min_diff])
\ No newline at end of file
+sys.stdout.write(' '.join('%d %d' % pair for pair in closest_pairs(ar)) + '\n')
@@ -1,12 +1,17 @@
-n = int(raw_input().strip())
-ar = [int(v) for v in raw_input().strip().split()]
+from array import array
 
-count = {}
+def count_items(ar, lo, hi):
+    '''Histogram of the values of ar, which must lie in range(lo, hi)'''
+    count = array('l', [0]) * (hi - lo)
+    for v in ar:
+        count[v - lo] += 1
+    return count
 
-for idx in range(100):
-    count[idx] = 0
+n = int(raw_input().strip())
+ar = [int(v) for v in raw_input().strip().split()]
 
-for v in ar:
-    count[v] += 1
+# Keys 0-99 are always reported; keys outside that range widen it
+lo, hi = min(min(ar), 0), max(max(ar), 99) + 1
+count = count_items(ar, lo, hi)
 
-print ' '.join(str(count[idx]) for idx in range(100))
\ No newline at end of file
+print ' '.join(str(c) for c in count)
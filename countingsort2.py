@@ -1,15 +1,22 @@
+from array import array
+
+def count_items(ar, lo, hi):
+    '''Histogram of the values of ar, which must lie in range(lo, hi)'''
+    count = array('l', [0]) * (hi - lo)
+    for v in ar:
+        count[v - lo] += 1
+    return count
+
 n = int(raw_input().strip())
 ar = [int(v) for v in raw_input().strip().split()]
 
-count = {}
-for idx in range(100):
-    count[idx] = 0
-for v in ar:
-    count[v] += 1
+lo, hi = min(ar), max(ar) + 1
+count = count_items(ar, lo, hi)
 
-result = ''
-for idx in range(100):
+# Collect the output pieces and join them once at the end
+result = []
+for idx in range(hi - lo):
     if count[idx] > 0:
-        result = ' '.join(result,' '.join(str(idx) for c in range(count[idx])))
+        result.extend([str(idx + lo)] * count[idx])
 
-print result
\ No newline at end of file
+print ' '.join(result)
@@ -1,24 +1,26 @@
+import sys
+from array import array
 
-def count_items(ar):
-    count = {}
-    for idx in range(100):
-        count[idx] = 0
+def count_items(ar, lo, hi):
+    '''Histogram of the values of ar, which must lie in range(lo, hi)'''
+    count = array('l', [0]) * (hi - lo)
     for v in ar:
-        count[v] += 1
+        count[v - lo] += 1
     return count
 
-n = int(raw_input().strip())
-ar = []
-for idx in range(n):
-    ar.append(int(raw_input().strip().split()[0]))
-count_map = count_items(ar)
-count = 0
-items_set = set(ar)
+tokens = sys.stdin.read().split()
+n = int(tokens[0])
+ar = [int(v) for v in tokens[1:2 * n + 1:2]]
+
+# Keys 0-99 are always reported; keys outside that range widen it
+lo, hi = min(min(ar), 0), max(max(ar), 99) + 1
+count_map = count_items(ar, lo, hi)
 
-result = ''
-for idx in range(100):
-    if idx in items_set:
-        count += count_map[idx]
-    result = result + ' ' + str(count)
+# Running totals: how many items are less than or equal to each key
+result = []
+count = 0
+for c in count_map:
+    count += c
+    result.append(str(count))
 
-print result.strip()
\ No newline at end of file
+print ' '.join(result)
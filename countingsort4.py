@@ -1,31 +1,34 @@
+import sys
+from array import array
 
-def count_items(ar):
-    count_map = {}
-    for idx in range(100):
-        count_map[idx] = [0, []]
-    for item in ar:
-        count_map[item[0]][0] += 1
-        count_map[item[0]][1].append(item[1])
-    return count_map
+def count_items(keys, lo, hi):
+    '''Histogram of keys, which must lie in range(lo, hi)'''
+    count = array('l', [0]) * (hi - lo)
+    for k in keys:
+        count[k - lo] += 1
+    return count
 
-n = int(raw_input().strip())
+def counting_sort(keys, payloads):
+    '''Stable sort of payloads by their integer keys in O(n + key range)'''
+    if not keys:
+        return []
+    lo = min(keys)
+    count = count_items(keys, lo, max(keys) + 1)
+    # Turn the counts into the first output position of every key
+    start = 0
+    for idx in range(len(count)):
+        count[idx], start = start, start + count[idx]
+    result = [None] * len(keys)
+    for k, v in zip(keys, payloads):
+        result[count[k - lo]] = v
+        count[k - lo] += 1
+    return result
 
-ar = []
-for idx in range(n):
-    first_half = False
-    if idx < n // 2: 
-        first_half = True
-    k, v = raw_input().strip().split()
-    if first_half:
-        ar.append((int(k), '-'))
-    else:
-        ar.append((int(k), v))
+tokens = sys.stdin.read().split()
+n = int(tokens[0])
+keys = [int(k) for k in tokens[1:2 * n + 1:2]]
+payloads = tokens[2:2 * n + 2:2]
+# The first half of the payloads is masked
+payloads[:n // 2] = ['-'] * (n // 2)
 
-count_map = count_items(ar)
-
-result = ''
-for idx in range(100):
-    if count_map[idx][0] > 0:
-        result = result + ' ' + ' '.join(str(item) for item in count_map[idx][1])
-
-print result.strip()
\ No newline at end of file
+print ' '.join(counting_sort(keys, payloads))
@@ -3,18 +3,15 @@
 
 import re
 
-def get_tags(s):
-    tag_pattern = r'<\s*([a-zA-Z]\w*)\s*?(?:\s+[a-zA-Z]\w*\s*=\s*".*?"\s*)*/?\s*>'
-    
-    tags = []
-    for m in re.finditer(tag_pattern, s):
-        ag = m.groups()
-        tags.append(m.group(1))
+tag_pattern = re.compile(r'<\s*([a-zA-Z]\w*)\s*?(?:\s+[a-zA-Z]\w*\s*=\s*".*?"\s*)*/?\s*>')
+
+def get_tags(lines):
+    '''Distinct tag names found in the lines'''
+    tags = set()
+    for s in lines:
+        tags.update(tag_pattern.findall(s))
     return tags
 
 n = int(raw_input().strip())
-tags = []
-for i in range(n):
-    s = raw_input().strip()
-    tags.extend(get_tags(s))
-print ';'.join(sorted(set(tags)))
\ No newline at end of file
+tags = get_tags(raw_input().strip() for i in xrange(n))
+print ';'.join(sorted(tags))
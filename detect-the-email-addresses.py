@@ -3,18 +3,15 @@
 
 import re
 
-def get_emails(s):
-    email_pattern = r'\b(\w+(?:\.\w+)*@(?:\w+\.)+\w+)\b'
-    
-    emails = []
-    for m in re.finditer(email_pattern, s):
-        ag = m.groups()
-        emails.append(m.group(1))
+email_pattern = re.compile(r'\b(\w+(?:\.\w+)*@(?:\w+\.)+\w+)\b')
+
+def get_emails(lines):
+    '''Distinct email addresses found in the lines'''
+    emails = set()
+    for s in lines:
+        emails.update(email_pattern.findall(s))
     return emails
 
 n = int(raw_input().strip())
-emails = []
-for i in range(n):
-    s = raw_input().strip()
-    emails.extend(get_emails(s))
-print ';'.join(sorted(set(emails)))
\ No newline at end of file
+emails = get_emails(raw_input().strip() for i in xrange(n))
+print ';'.join(sorted(emails))
@@ -2,15 +2,36 @@
 # Solution for https://www.hackerrank.com/challenges/divisible-sum-pairs
 
 import sys
+from collections import Counter
 
+def count_divisible_pairs(a, ks):
+    '''For every k in ks, the number of pairs i < j with (a[i] + a[j]) % k == 0.
+    Values are counted once, then bucketed by remainder in O(distinct + k) per k.'''
+    frequencies = Counter(a)
+    results = []
+    for k in ks:
+        remainders = [0] * k
+        for v, count in frequencies.iteritems():
+            remainders[v % k] += count
+        pairs = remainders[0] * (remainders[0] - 1) // 2
+        for r in xrange(1, k // 2 + 1):
+            if r == k - r:
+                pairs += remainders[r] * (remainders[r] - 1) // 2
+            else:
+                pairs += remainders[r] * remainders[k - r]
+        results.append(pairs)
+    return results
 
-n,k = raw_input().strip().split(' ')
-n,k = [int(n),int(k)]
-a = map(int,raw_input().strip().split(' '))
+def divisible_pairs(a, k):
+    '''Yields the index pairs (i, j), i < j, with (a[i] + a[j]) % k == 0'''
+    seen = {}
+    for j, v in enumerate(a):
+        for i in seen.get(-v % k, ()):
+            yield i, j
+        seen.setdefault(v % k, []).append(j)
 
-div_count = 0
-for idx1 in range(len(a)):
-    for idx2 in range(idx1 + 1, len(a)):
-        if not ((a[idx1] + a[idx2]) % k):
-            div_count += 1
-print div_count
\ No newline at end of file
+data = sys.stdin.read().split()
+n,k = [int(data[0]),int(data[1])]
+a = map(int, data[2:n + 2])
+
+print count_divisible_pairs(a, [k])[0]
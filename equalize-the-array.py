@@ -1,17 +1,15 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/equality-in-a-array
 
-n = int(raw_input().strip())
-a = [int(x) for x in raw_input().strip().split(' ')]
+import sys
+from collections import Counter
 
-fr = {}
-max_fr_key = None
-max_fr = 0
-for v in a:
-    fr.setdefault(v, 0)
-    fr[v] += 1
-    if max_fr < fr[v]:
-        max_fr = fr[v]
-        max_fr_key = v
-min_deletes = sum((fr[v] for v in fr if v != max_fr_key))
-print min_deletes
\ No newline at end of file
+def min_deletes(a):
+    '''Deletions needed to leave only copies of the most frequent value'''
+    fr = Counter(a)
+    return sum(fr.itervalues()) - max(fr.itervalues())
+
+data = sys.stdin.read().split()
+n = int(data[0])
+
+print min_deletes(int(x) for x in data[1:n + 1])
\ No newline at end of file
@@ -3,31 +3,26 @@
 
 import sys
 
-N = int(raw_input().strip())
-B = [int(x) for x in raw_input().strip().split(' ')]
+def min_loaves(B):
+    '''Loaves to hand out so everyone holds an even number, or None when impossible.
+    An odd holder and the next person each take one, passing the parity along the line.'''
+    loaves = 0
+    carry = 0
+    for b in B:
+        if (b + carry) % 2:
+            loaves += 2
+            carry = 1
+        else:
+            carry = 0
+    if carry:
+        return None
+    return loaves
 
-def is_impossible(dist):
-    return len([x for x in dist if x%2])%2
+data = sys.stdin.read().split()
+N = int(data[0])
+count = min_loaves(int(x) for x in data[1:N + 1])
 
-if is_impossible(B):
+if count is None:
     print 'NO'
 else:
-    count = 0
-    idx1 = 0
-    idx2 = 0
-    while idx1 < len(B):
-
-        if not B[idx1]%2:
-            idx1 += 1
-            continue
-            
-        idx2 = idx1 + 1
-        while idx2 < len(B) and not B[idx2]%2:
-            idx2 += 1
-        
-        if idx1 < idx2 < len(B):
-            count += (idx2 - idx1) * 2
-
-        idx1 = idx2 + 1
-
-    print count
\ No newline at end of file
+    print count
@@ -1,26 +1,82 @@
-def partition(ar, median_idx):
-    left, middle, right = [], [], []
-    pivot = ar[median_idx]
-    for v in ar:
+#!/bin/python
+# Solution for https://www.hackerrank.com/challenges/find-the-median
+
+import heapq
+
+def partition(ar, left, right, pivot):
+    '''Three-way partition of ar[left:right+1] in place.
+    Returns (lt, gt) so that ar[lt:gt+1] holds the values equal to pivot'''
+    lt, idx, gt = left, left, right
+    while idx <= gt:
+        v = ar[idx]
         if v < pivot:
-            left.append(v)
+            ar[lt], ar[idx] = v, ar[lt]
+            lt += 1
+            idx += 1
         elif v > pivot:
-            right.append(v)
+            ar[gt], ar[idx] = v, ar[gt]
+            gt -= 1
         else:
-            middle.append(v)
-    median_found = len(left) <= median_idx <= len(left) + len(middle)
-    return left+middle+right, median_found
+            idx += 1
+    return lt, gt
 
-def median(ar):
-    median_idx = len(ar) // 2
-    pivot_idx = 0
-    while True:
-        ar, median_found = partition(ar, median_idx)
-        if median_found:
+def select(ar, k, left=0, right=None):
+    '''k-th smallest value (0 based) of ar[left:right+1], reordering ar in place.
+    Afterwards no value left of k is greater and no value right of k is smaller.'''
+    if right is None:
+        right = len(ar) - 1
+    # Introselect: give up on pivots after 2*log2(n) rounds and sort what is left
+    rounds_left = 2 * max(right - left + 1, 1).bit_length()
+    while left < right:
+        if rounds_left == 0:
+            ar[left:right + 1] = sorted(ar[left:right + 1])
             break
-    return ar[median_idx]
+        rounds_left -= 1
+        pivot = sorted((ar[left], ar[(left + right) // 2], ar[right]))[1]
+        lt, gt = partition(ar, left, right, pivot)
+        if k < lt:
+            right = lt - 1
+        elif k > gt:
+            left = gt + 1
+        else:
+            break
+    return ar[k]
+
+def quantiles(ar, qs):
+    '''Values of ar at each quantile in qs (e.g. 0.5, 0.9, 0.99), reordering ar in place'''
+    if not ar:
+        return []
+    ks = sorted(set(int(q * (len(ar) - 1)) for q in qs))
+    values = {}
+    left = 0
+    for k in ks:
+        # Every value before the last selected index is already no greater than it
+        values[k] = select(ar, k, left)
+        left = k
+    return [values[int(q * (len(ar) - 1))] for q in qs]
+
+def median(ar):
+    return select(ar, len(ar) // 2)
+
+def running_median(values):
+    '''Yields the median of the values seen so far, keeping them in two heaps'''
+    low, high = [], [] # low is a max-heap stored negated
+    for v in values:
+        if low and v > -low[0]:
+            heapq.heappush(high, v)
+        else:
+            heapq.heappush(low, -v)
+        if len(low) > len(high) + 1:
+            heapq.heappush(high, -heapq.heappop(low))
+        elif len(high) > len(low):
+            heapq.heappush(low, -heapq.heappop(high))
+        if len(low) > len(high):
+            yield -low[0]
+        else:
+            yield (-low[0] + high[0]) / 2.0
 
-n = int(raw_input().strip())
-ar = [int(v) for v in raw_input().strip().split()]
+if __name__ == '__main__':
+    n = int(raw_input().strip())
+    ar = [int(v) for v in raw_input().strip().split()]
 
-print median(ar)
\ No newline at end of file
+    print median(ar)
@@ -2,6 +2,7 @@
 # Solution for https://www.hackerrank.com/challenges/grading
 
 import sys
+from multiquery import write_lines
 
 def round_grade(grade):
     if grade >= 38 and grade % 5 >= 3:
@@ -11,6 +12,4 @@ def round_grade(grade):
     return result
 
 n = int(raw_input().strip())
-for a0 in xrange(n):
-    grade = int(raw_input().strip())
-    print round_grade(grade)
+write_lines(str(round_grade(int(raw_input().strip()))) for a0 in xrange(n))
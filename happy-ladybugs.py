@@ -2,6 +2,7 @@
 # Solution for https://www.hackerrank.com/challenges/happy-ladybugs
 
 import sys
+from multiquery import solve_all, write_lines
 
 empty = '_'
 
@@ -17,16 +18,19 @@ def is_happy(s):
             return False
     return True
 
-Q = int(raw_input().strip())
-for a0 in xrange(Q):
-    n = int(raw_input().strip())
-    b = raw_input().strip()
-
+def can_be_happy(b):
     empty_count = b.count(empty)
     b_counts = { c: b.count(c) for c in (set(b) - { empty }) }
     if any((v == 1 for v in b_counts.values())):
-        print 'NO'
+        return 'NO'
     elif empty_count <= 0 and not is_happy(b):
-        print 'NO'
+        return 'NO'
     else:
-        print 'YES'
\ No newline at end of file
+        return 'YES'
+
+if __name__ == '__main__':
+    data = sys.stdin.read().split()
+    Q = int(data[0])
+    cases = data[2:2 * Q + 1:2]
+
+    write_lines(solve_all(can_be_happy, cases, chunksize=1000, min_parallel=10000))
\ No newline at end of file
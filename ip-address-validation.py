@@ -1,31 +1,45 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/ip-address-validation
 
-import re
+import string
+from multiquery import write_lines
 
 def is_ipv4(val):
-    v4_pattern = r'\b(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})\b'
-    match = re.search(v4_pattern, val)
-    if match:
-        for v in (int(x) for x in match.groups()):
-            if not (0 <= v <= 255):
-                return False
-        return True
-    return False
-    
+    parts = val.split('.')
+    if len(parts) != 4:
+        return False
+    for part in parts:
+        if not (0 < len(part) <= 3 and part.isdigit() and int(part) <= 255):
+            return False
+    return True
+
+def is_hex_group(part):
+    return 0 < len(part) <= 4 and not part.strip(string.hexdigits)
+
 def is_ipv6(val):
-    v6_pattern = r'\b([0-9abcdef]{1,4}):([0-9abcdef]{1,4}):([0-9abcdef]{1,4}):([0-9abcdef]{1,4}):([0-9abcdef]{1,4}):([0-9abcdef]{1,4}):([0-9abcdef]{1,4}):([0-9abcdef]{1,4})\b'
-    match = re.search(v6_pattern, val)
-    if match:
-        return True
-    return False
+    if '::' in val:
+        # A single '::' stands for one or more groups of zeros
+        parts = val.split('::')
+        if len(parts) != 2:
+            return False
+        groups = [g for part in parts if part for g in part.split(':')]
+        max_groups = 7
+    else:
+        groups = val.split(':')
+        max_groups = 8
+        if len(groups) != max_groups:
+            return False
+    return len(groups) <= max_groups and all(is_hex_group(g) for g in groups)
+
+def classify_addresses(lines):
+    '''Yields IPv4, IPv6 or Neither for every line'''
+    for v in lines:
+        if is_ipv4(v):
+            yield 'IPv4'
+        elif is_ipv6(v):
+            yield 'IPv6'
+        else:
+            yield 'Neither'
 
 n = int(raw_input().strip())
-for i in range(n):
-    v = raw_input().strip()
-    if is_ipv4(v):
-        print 'IPv4'
-    elif is_ipv6(v):
-        print 'IPv6'
-    else:
-        print 'Neither'
\ No newline at end of file
+write_lines(classify_addresses(raw_input().strip() for i in xrange(n)))
@@ -3,22 +3,24 @@
 # Solution for https://www.hackerrank.com/challenges/jumping-on-the-clouds-revisited
 
 import sys
+from fractions import gcd
+
+def energies_left(c, ks, E=100):
+    '''Energy left after the game for every jump length in ks.
+    Jumping by k visits each multiple of g = gcd(n, k) once, n / g jumps in total,
+    so only the thunderclouds in c[::g] matter; their sums are shared between queries.'''
+    n = len(c)
+    thunderclouds = {}
+    result = []
+    for k in ks:
+        g = gcd(n, k)
+        if g not in thunderclouds:
+            thunderclouds[g] = sum(c[::g])
+        result.append(E - n // g - 2 * thunderclouds[g])
+    return result
 
 n,k = raw_input().strip().split(' ')
 n,k = [int(n),int(k)]
 c = map(int,raw_input().strip().split(' '))
 
-E = 100
-current = 0
-time = 0
-
-while not (time > 0 and current == 0):
-    current += k
-    current = current % n
-    if c[current] == 0:
-        E -= 1
-    if c[current] == 1:
-        E -= 3
-    time += 1
-
-print E
\ No newline at end of file
+print energies_left(c, [k])[0]
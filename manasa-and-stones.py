@@ -1,10 +1,16 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/manasa-and-stones
 
-T = int(raw_input().strip())
-for case in xrange(T):
-    n = int(raw_input().strip())
-    a = int(raw_input().strip())
-    b = int(raw_input().strip())
+import sys
+from multiquery import write_lines
+
+def last_stones(case):
+    n, a, b = case
     a, b = min(a, b), max(a, b)
-    print ' '.join(str(v) for v in sorted(list(set((a*(n - k) + b*k for k in xrange(n+1))))))
\ No newline at end of file
+    return ' '.join(str(v) for v in sorted(list(set((a*(n - k) + b*k for k in xrange(n+1))))))
+
+data = map(int, sys.stdin.read().split())
+T = data[0]
+cases = [data[idx:idx + 3] for idx in xrange(1, 3 * T + 1, 3)]
+
+write_lines(last_stones(case) for case in cases)
\ No newline at end of file
@@ -1,14 +1,15 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/migratory-birds
 
-n = int(raw_input().strip())
-values = [int(x) for x in raw_input().strip().split(' ')]
-frequencies = {1:0, 2:0, 3:0, 4:0, 5:0}
-max_frequency = 0
-max_type = 5
-for v in values:
-    frequencies[v] += 1
-    if max_frequency < frequencies[v] or (max_frequency == frequencies[v] and v < max_type):
-        max_type = v
-        max_frequency = frequencies[v]
-print max_type
\ No newline at end of file
+import sys
+from collections import Counter
+
+def most_common_type(values):
+    '''The most frequent value, the smallest one on ties'''
+    frequencies = Counter(values)
+    return min(frequencies, key=lambda v: (-frequencies[v], v))
+
+data = sys.stdin.read().split()
+n = int(data[0])
+
+print most_common_type(int(x) for x in data[1:n + 1])
\ No newline at end of file
@@ -2,23 +2,29 @@
 # Solution for https://www.hackerrank.com/challenges/minimum-distances
 
 import sys
+import heapq
 
-n = int(raw_input().strip())
-arr = map(int,raw_input().strip().split(' '))
+def repeat_gaps(values):
+    '''Yields (distance, i, j) for every index j whose value last occurred at index i'''
+    last_seen = {}
+    for idx, val in enumerate(values):
+        if val in last_seen:
+            yield idx - last_seen[val], last_seen[val], idx
+        last_seen[val] = idx
 
-fr = {}
-for idx, val in enumerate(arr):
-    fr.setdefault(val, []).append(idx)
+def min_distance(values):
+    '''Smallest distance between two equal values, or -1 if every value is unique'''
+    min_gap = -1
+    for gap, i, j in repeat_gaps(values):
+        if min_gap == -1 or gap < min_gap:
+            min_gap = gap
+    return min_gap
 
-min_distance = len(arr)
-for val in fr:
-    if len(fr[val]) > 1:
-        idxs = list(sorted(fr[val]))
-        local_min_distance = abs(idxs[0] - idxs[-1])
-        if min_distance > local_min_distance:
-            min_distance = local_min_distance
+def closest_pairs(values, k):
+    '''The k closest pairs of neighbouring equal values as (distance, i, j), keeping only k in memory'''
+    return heapq.nsmallest(k, repeat_gaps(values))
 
-if min_distance == len(arr):
-    print -1 
-else:
-    print min_distance
\ No newline at end of file
+data = sys.stdin.read().split()
+n = int(data[0])
+
+print min_distance(int(x) for x in data[1:n + 1])
@@ -0,0 +1,33 @@
+# Helpers shared by the multi-query solutions
+
+import sys
+from itertools import imap
+from multiprocessing import Pool, cpu_count
+
+def write_lines(lines, batch_size=4096):
+    '''Writes the lines with one sys.stdout.write per batch_size of them,
+    so memory stays flat however many answers are streamed through'''
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= batch_size:
+            sys.stdout.write('\n'.join(batch) + '\n')
+            del batch[:]
+    if batch:
+        sys.stdout.write('\n'.join(batch) + '\n')
+
+def solve_all(solve, cases, chunksize, min_parallel):
+    '''Yields solve(case) for every case, in input order. With at least
+    min_parallel cases and more than one core, chunks of chunksize cases are
+    spread over a process pool, so solve must be a module level function.'''
+    if len(cases) < min_parallel or cpu_count() == 1:
+        for result in imap(solve, cases):
+            yield result
+        return
+    pool = Pool()
+    try:
+        for result in pool.imap(solve, cases, chunksize):
+            yield result
+    finally:
+        pool.close()
+        pool.join()
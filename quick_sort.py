@@ -16,12 +16,26 @@ def partition(ar):
     return left, equal, right
 
 def quick_sort(ar):
-    if len(ar) <= 1:
-        return ar
-    left, equal, right = partition(ar)
-    result = quick_sort(left) + equal + quick_sort(right)
-    print(' '.join(str(v) for v in result))
-    return result
+    # Explicit stack instead of recursion, so sorted input can't hit the
+    # recursion limit; sub-lists are still merged and printed in the same order
+    sorted_parts = []
+    pending = [(False, ar)]
+    while pending:
+        is_merge, part = pending.pop()
+        if is_merge:
+            right = sorted_parts.pop()
+            left = sorted_parts.pop()
+            result = left + part + right
+            print(' '.join(str(v) for v in result))
+            sorted_parts.append(result)
+        elif len(part) <= 1:
+            sorted_parts.append(part)
+        else:
+            left, equal, right = partition(part)
+            pending.append((True, equal))
+            pending.append((False, right))
+            pending.append((False, left))
+    return sorted_parts.pop()
 
 m = input()
 ar = [int(i) for i in raw_input().strip().split()]
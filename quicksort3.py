@@ -23,11 +23,16 @@ def partition(ar, left, right):
     return left_idx
 
 def quick_sort(ar, left, right):
-    if left >= right:
-        return ar
-    pivot_idx = partition(ar, left, right)
-    quick_sort(ar, left, pivot_idx-1)
-    quick_sort(ar, pivot_idx+1, right)
+    # Explicit stack instead of recursion; left ranges are popped first so the
+    # partitions are printed in the same order as the recursive version
+    ranges = [(left, right)]
+    while ranges:
+        left, right = ranges.pop()
+        if left >= right:
+            continue
+        pivot_idx = partition(ar, left, right)
+        ranges.append((pivot_idx+1, right))
+        ranges.append((left, pivot_idx-1))
     return ar
 
 #m = input()
@@ -27,38 +27,48 @@ def partition(ar, left, right):
     return left_idx, shifts
 
 def quick_sort(ar, left, right):
+    # Explicit stack instead of recursion, so sorted input can't hit the recursion limit
     shifts = 0
-    if left < right:
-        pivot_idx, shifts = partition(ar, left, right)
-        shifts += quick_sort(ar, left, pivot_idx-1)
-        shifts += quick_sort(ar, pivot_idx+1, right)
+    ranges = [(left, right)]
+    while ranges:
+        left, right = ranges.pop()
+        if left >= right:
+            continue
+        pivot_idx, partition_shifts = partition(ar, left, right)
+        shifts += partition_shifts
+        ranges.append((pivot_idx+1, right))
+        ranges.append((left, pivot_idx-1))
     return shifts
 
 '''Insertion Sort'''
 
-def insertNewElement(ar, pos):
+def insertion_shifts(ar, per_prefix=False):
+    '''Shifts insertion sort would make on ar, counted as inversions with a Fenwick tree.
+    With per_prefix the running count after each inserted element is returned instead.'''
+    ranks = dict((v, idx + 1) for idx, v in enumerate(sorted(set(ar))))
+    tree = [0] * (len(ranks) + 1)
     shifts = 0
-    e = ar[pos]
-    idx = pos - 1
-    while idx >=0 and ar[idx] > e:
-        shifts += 1
-        ar[idx+1] = ar[idx]
-        idx -= 1
-    ar[idx+1] = e
-    return shifts
-
-def insertionSort(ar):
-    shifts = 0
-
-    if len(ar) <= 1:
-        return
-    for pos in range(1, len(ar)):
-        shifts += insertNewElement(ar, pos)
-        #print(' '.join(str(v) for v in ar))
+    prefix_shifts = []
+    for pos, v in enumerate(ar):
+        # Elements already inserted that are not greater than v stay in place
+        not_greater = 0
+        idx = ranks[v]
+        while idx > 0:
+            not_greater += tree[idx]
+            idx -= idx & -idx
+        shifts += pos - not_greater
+        idx = ranks[v]
+        while idx < len(tree):
+            tree[idx] += 1
+            idx += idx & -idx
+        if per_prefix:
+            prefix_shifts.append(shifts)
+    if per_prefix:
+        return prefix_shifts
     return shifts
 
 #m = input()
 #ar = [int(i) for i in raw_input().strip().split()]
 ar1 = [4, 2, 1, 3, 9, 9, 8, 3, 2, 7, 5]
 ar2 = list(ar1[:])
-print(insertionSort(ar1) - quick_sort(ar2, 0, len(ar2) - 1))
\ No newline at end of file
+print(insertion_shifts(ar1) - quick_sort(ar2, 0, len(ar2) - 1))
\ No newline at end of file
@@ -1,25 +1,32 @@
 #!/bin/python
-def insertNewElement(ar, pos):
-    shifts = 0
-    e = ar[pos]
-    idx = pos - 1
-    while idx >=0 and ar[idx] > e:
-        shifts += 1
-        ar[idx+1] = ar[idx]
-        idx -= 1
-    ar[idx+1] = e
-    return shifts
 
-def insertionSort(ar):
-    shifts = 0
+import sys
 
-    if len(ar) <= 1:
-        return
-    for pos in range(1, len(ar)):
-        shifts += insertNewElement(ar, pos)
-        #print(' '.join(str(v) for v in ar))
+def insertion_shifts(ar, per_prefix=False):
+    '''Shifts insertion sort would make on ar, counted as inversions with a Fenwick tree.
+    With per_prefix the running count after each inserted element is returned instead.'''
+    ranks = dict((v, idx + 1) for idx, v in enumerate(sorted(set(ar))))
+    tree = [0] * (len(ranks) + 1)
+    shifts = 0
+    prefix_shifts = []
+    for pos, v in enumerate(ar):
+        # Elements already inserted that are not greater than v stay in place
+        not_greater = 0
+        idx = ranks[v]
+        while idx > 0:
+            not_greater += tree[idx]
+            idx -= idx & -idx
+        shifts += pos - not_greater
+        idx = ranks[v]
+        while idx < len(tree):
+            tree[idx] += 1
+            idx += idx & -idx
+        if per_prefix:
+            prefix_shifts.append(shifts)
+    if per_prefix:
+        return prefix_shifts
     return shifts
 
-m = input()
-ar = [int(i) for i in raw_input().strip().split()]
-print(insertionSort(ar))
\ No newline at end of file
+data = sys.stdin.read().split()
+ar = [int(i) for i in data[1:]]
+print(insertion_shifts(ar))
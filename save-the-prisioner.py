@@ -2,11 +2,16 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/save-the-prisoner
 import sys
+from multiquery import write_lines
 
-t = int(raw_input().strip())
-
-for i in range(t):
-    n, m, s = [int(x) for x in raw_input().strip().split(' ')]
+def last_prisoner(case):
+    n, m, s = case
     last = (s + m - 1) % n
     if last == 0: last = n
-    print last
\ No newline at end of file
+    return last
+
+data = map(int, sys.stdin.read().split())
+t = data[0]
+cases = [data[idx:idx + 3] for idx in xrange(1, 3 * t + 1, 3)]
+
+write_lines(str(last_prisoner(case)) for case in cases)
\ No newline at end of file
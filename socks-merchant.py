@@ -3,19 +3,13 @@
 # Solution for https://www.hackerrank.com/challenges/sock-merchant
 
 import sys
+from collections import Counter
 
-n = int(raw_input().strip())
-c = [int(x) for x in raw_input().strip().split(' ')]
+def count_pairs(c):
+    '''Matching pairs of socks, counting every color in a single pass'''
+    return sum(f // 2 for f in Counter(c).itervalues())
 
-frequecies = {}
-for idx in range(len(c)):
-    if c[idx] in frequecies:
-        frequecies[c[idx]] += 1
-    else:
-        frequecies[c[idx]] = 1
+data = sys.stdin.read().split()
+n = int(data[0])
 
-pairs = 0
-for key in frequecies.keys():
-    pairs += frequecies[key] // 2
-    
-print pairs
\ No newline at end of file
+print count_pairs(int(x) for x in data[1:n + 1])
\ No newline at end of file
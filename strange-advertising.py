@@ -2,16 +2,22 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/strange-advertising
 
-n = int(raw_input().strip())
+def cumulative_likes(days):
+    '''Total likes after each of the given days, found in one pass up to the largest day'''
+    totals = {}
+    current = 2
+    total = current
+    day = 1
+    for n in sorted(set(days)):
+        while day < n:
+            current = (current * 3) // 2
+            total += current
+            day += 1
+        totals[n] = total
+    return [totals[n] for n in days]
 
-total = 0
-current = 2
-total = current
+n = int(raw_input().strip())
 
-for day in range(n-1):
-    current = (current * 3) // 2
-    total += current
-    
-print total    
+print cumulative_likes([n])[0]
 
-#f(n+1) = f(n) * 3 // 2
\ No newline at end of file
+#f(n+1) = f(n) * 3 // 2
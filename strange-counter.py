@@ -4,25 +4,13 @@
 
 import sys
 
+def counter_value(t):
+    '''Value shown at time t. Period p lasts 3 * 2**(p - 1) seconds and ends at
+    time 3 * (2**p - 1), so t falls in the period p = bit_length(ceil(t / 3))'''
+    period = ((t + 2) // 3).bit_length()
+    return 3 * 2**period - t - 2
+
 t = int(raw_input().strip())
 #t = 21
 
-initial_counter = 3
-counter = initial_counter
-
-periodSum = 0
-
-period = 1
-periodLength = 3 * (2**(period - 1))
-lastPeriodSum = 0
-periodSum += periodLength
-
-while periodSum < t:
-    period += 1
-    periodLength = 3 * (2**(period - 1))
-    lastPeriodSum = periodSum
-    periodSum += periodLength
-
-counter_value = periodLength - (t - lastPeriodSum) + 1
-    
-print counter_value
\ No newline at end of file
+print counter_value(t)
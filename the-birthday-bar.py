@@ -1,22 +1,25 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/the-birthday-bar
 
+from collections import Counter
+
+def count_splits(values, queries):
+    '''For every (d, m) in queries, the number of m consecutive squares summing to d.
+    Window sums come from one prefix-sum array and are counted once per distinct m.'''
+    prefix = [0]
+    for v in values:
+        prefix.append(prefix[-1] + v)
+    window_sums = {}
+    result = []
+    for d, m in queries:
+        if m not in window_sums:
+            window_sums[m] = Counter(prefix[idx + m] - prefix[idx]
+                                     for idx in xrange(len(values) - m + 1))
+        result.append(window_sums[m][d])
+    return result
+
 n = int(raw_input().strip())
 values = [int(x) for x in raw_input().strip().split(' ')]
 d, m  = [int(x) for x in raw_input().strip().split(' ')]
 
-split_count = 0
-
-if len(values) >= m:
-    val_sum = sum(values[:m])
-    if val_sum == d:
-        split_count += 1
-    idx_l, idx_r = 0, m
-    while idx_r < len(values):
-        val_sum += values[idx_r]
-        val_sum -= values[idx_l]
-        if val_sum == d:
-            split_count += 1
-        idx_l, idx_r = idx_l + 1, idx_r + 1
-
-print split_count
\ No newline at end of file
+print count_splits(values, [(d, m)])[0]
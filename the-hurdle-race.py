@@ -3,11 +3,10 @@
 
 import sys
 
-n,k = raw_input().strip().split(' ')
-n,k = [int(n),int(k)]
-height = map(int, raw_input().strip().split(' '))
+data = sys.stdin.read().split()
+n,k = [int(data[0]),int(data[1])]
 
-max_height = max(height)
+max_height = max(int(x) for x in data[2:n + 2])
 if k < max_height:
     print max_height - k
 else:
@@ -1,13 +1,21 @@
 #!/bin/python
 # Solution for https://www.hackerrank.com/challenges/the-love-letter-mystery
 
-T = int(raw_input().strip())
-for c in xrange(T):
-    s = raw_input().strip()
-    result = 0
-    for idx in xrange(len(s)//2):
-        c1 = s[idx]
-        c2 = s[(idx+1)*-1]
-        if c1 != c2:
-            result += abs(ord(c1) - ord(c2))
-    print result
\ No newline at end of file
+import sys
+from itertools import izip
+from multiquery import solve_all, write_lines
+
+def palindrome_operations(s):
+    '''Sum of the byte differences between the first half of s and its mirror'''
+    half = len(s) // 2
+    front = bytearray(s[:half])
+    back = bytearray(s[::-1][:half])
+    return sum(abs(c1 - c2) for c1, c2 in izip(front, back))
+
+if __name__ == '__main__':
+    data = sys.stdin.read().split()
+    T = int(data[0])
+    cases = data[1:T + 1]
+
+    results = solve_all(palindrome_operations, cases, chunksize=1000, min_parallel=10000)
+    write_lines(str(result) for result in results)
\ No newline at end of file
@@ -3,36 +3,33 @@
 # Solution for https://www.hackerrank.com/challenges/two-characters
 
 import sys
-import itertools
 
-def trim_except(s, pair):
-    result = []
-    for cur in s:
-        if cur in pair:
-            result.append(cur)
-    return ''.join(result)
+letters_count = 26
+invalid = -1
 
-def is_alternating(s):
-    if len(s) <= 1:
-        return True
-    chrEven = s[0]
-    chrOdd = s[1]
-    for idx, cur in enumerate(s):
-        if not idx % 2 and cur != chrEven:
-            return False
-        if idx % 2 and cur != chrOdd:
-            return False
-    return True
+def max_alternating(s):
+    '''Length of the longest alternating string made of two characters of s.
+    For every pair of letters the table keeps the last of the two seen and the
+    length so far, so each character only updates the 25 pairs containing it.'''
+    last = [None] * (letters_count * letters_count)
+    length = [0] * (letters_count * letters_count)
+    for c in s:
+        i = ord(c) - ord('a')
+        for j in xrange(letters_count):
+            if j == i:
+                continue
+            pair = i * letters_count + j if i < j else j * letters_count + i
+            if length[pair] == invalid:
+                continue
+            if last[pair] == i:
+                length[pair] = invalid
+            else:
+                last[pair] = i
+                length[pair] += 1
+    # A single letter seen once also leaves a length of 1 behind
+    return max([l for l in length if l > 1] + [0])
 
 s_len = int(raw_input().strip())
 s = raw_input().strip()
 
-maxAlternating = 0
-chrSet = set(s)
-chrCombinations = itertools.combinations(chrSet, 2)
-for pair in chrCombinations:
-    sTrimmed = trim_except(s, pair)
-    if is_alternating(sTrimmed) and len(sTrimmed) > maxAlternating:
-        maxAlternating = len(sTrimmed)
-        
-print maxAlternating
\ No newline at end of file
+print max_alternating(s)